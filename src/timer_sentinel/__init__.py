@@ -1,3 +1,3 @@
-from .core import TimerSentinel
+from .core import TimerSentinel, sentinel
 
-__all__ = ["TimerSentinel"]
+__all__ = ["TimerSentinel", "sentinel"]
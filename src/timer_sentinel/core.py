@@ -1,13 +1,21 @@
-import asyncio
 import inspect
 import logging
+import math
+import os
+import queue
+import threading
 import time
 from collections.abc import Callable
-from functools import wraps
-from typing import Any
-from uuid import uuid4
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import asyncio
 
 DEFAULT_TIMER_NAME = "TimerSentinel"
+# Bound once so hot paths skip the attribute lookup on the time module
+_perf_counter_ns = time.perf_counter_ns
+_is_coro = inspect.iscoroutinefunction
 default_logger = logging.getLogger("TimerSentinel")
 logging.basicConfig(
     level=logging.INFO,
@@ -15,6 +23,149 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+_REPORT_MSG = "%s | name=%s | id=%s | elapsed=%.4fs | threshold=%.4fs"
+_SENTINEL_MSG = "OVERTIME | name=%s | elapsed=%.4fs | threshold=%.4fs"
+# Elapsed nanoseconds never reach this; used for an infinite threshold
+_NEVER_EXCEEDED_NS = 2**63 - 1
+
+
+def _threshold_to_ns(threshold: float) -> int:
+    """Convert a threshold in seconds to integer nanoseconds.
+
+    Thresholds too large to represent, including infinity, map to a value
+    no elapsed time can exceed. Negative thresholds map to -1, which every
+    elapsed time exceeds.
+
+    Raises:
+        ValueError: If threshold is NaN.
+    """
+    if math.isnan(threshold):
+        raise ValueError("threshold must not be NaN")
+    threshold_ns = threshold * 1e9
+    if threshold_ns >= _NEVER_EXCEEDED_NS:
+        return _NEVER_EXCEEDED_NS
+    if threshold_ns < 0:
+        return -1
+    return int(threshold_ns)
+
+
+# Execution ids are drawn from a shared pool of random bytes so that
+# os.urandom is called once per refill rather than once per id. The pool
+# is hex encoded on refill so each id is a single string slice.
+_RAND_POOL_SIZE = 4096
+_RAND_ID_CHARS = 8
+_RAND_HEX = ""
+_RAND_OFF = 0
+_RAND_LOCK = threading.Lock()
+
+
+def _short_id() -> str:
+    """Return a random 8 hex character id from the shared random pool."""
+    global _RAND_HEX, _RAND_OFF
+    with _RAND_LOCK:
+        if len(_RAND_HEX) < _RAND_OFF + _RAND_ID_CHARS:
+            _RAND_HEX = os.urandom(_RAND_POOL_SIZE).hex()
+            _RAND_OFF = 0
+        start = _RAND_OFF
+        _RAND_OFF += _RAND_ID_CHARS
+        return _RAND_HEX[start : start + _RAND_ID_CHARS]
+
+
+def _reset_id_pool() -> None:
+    """Discard the parent's random pool and lock in a forked child.
+
+    Without this a parent and its children would hand out the same ids,
+    and a lock held by another thread during fork would never be released.
+    """
+    global _RAND_HEX, _RAND_OFF, _RAND_LOCK
+    _RAND_HEX = ""
+    _RAND_OFF = 0
+    _RAND_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+# Reports created with async_report=True are handed to a single daemon
+# thread, so the timed code does not wait on log I/O or the callback.
+# Each entry is (timer, name, log_args, callback); log_args is None when
+# the level is disabled and callback is None when there is none.
+# The queue is bounded so a slow handler or callback cannot grow memory
+# without limit: when it is full, new reports are dropped and counted,
+# and the worker logs how many were lost once it catches up. Dropped
+# reports can come from any timer, so that warning goes to the package's
+# default_logger rather than to a timer's own logger.
+_Report = tuple["TimerSentinel", str, tuple[Any, ...] | None, Callable[[], None] | None]
+_REPORT_QUEUE_SIZE = 1024
+_REPORT_QUEUE: queue.Queue[_Report] = queue.Queue(maxsize=_REPORT_QUEUE_SIZE)
+_REPORT_DROPPED = 0
+_REPORT_WORKER: threading.Thread | None = None
+_REPORT_WORKER_LOCK = threading.Lock()
+
+
+def _emit_report(report: _Report) -> None:
+    """Log the overtime message and run the callback of a report."""
+    timer, _, log_args, callback = report
+    if log_args is not None:
+        timer._log(timer._on_exceed_level, _REPORT_MSG, *log_args)
+    if callback is not None:
+        callback()
+
+
+def _report_worker() -> None:
+    """Emit queued reports forever, logging any failure."""
+    global _REPORT_DROPPED
+    while True:
+        report = _REPORT_QUEUE.get()
+        try:
+            _emit_report(report)
+        except Exception:
+            timer, name = report[0], report[1]
+            timer._logger.exception(
+                "%s | name=%s | background report failed",
+                timer._on_exceed_keyword,
+                name,
+            )
+        if _REPORT_DROPPED:
+            with _REPORT_WORKER_LOCK:
+                dropped, _REPORT_DROPPED = _REPORT_DROPPED, 0
+            default_logger.warning("Dropped %d background reports: queue full", dropped)
+
+
+def _submit_report(report: _Report) -> None:
+    """Queue a report, starting the worker thread on first use.
+
+    The report is dropped and counted if the queue is full.
+    """
+    global _REPORT_DROPPED, _REPORT_WORKER
+    try:
+        _REPORT_QUEUE.put_nowait(report)
+    except queue.Full:
+        with _REPORT_WORKER_LOCK:
+            _REPORT_DROPPED += 1
+    if _REPORT_WORKER is None:
+        with _REPORT_WORKER_LOCK:
+            if _REPORT_WORKER is None:
+                worker = threading.Thread(
+                    target=_report_worker, name="TimerSentinelReporter", daemon=True
+                )
+                worker.start()
+                _REPORT_WORKER = worker
+
+
+def _reset_report_worker() -> None:
+    """Forget the parent's worker and queue in a forked child."""
+    global _REPORT_QUEUE, _REPORT_DROPPED, _REPORT_WORKER, _REPORT_WORKER_LOCK
+    _REPORT_QUEUE = queue.Queue(maxsize=_REPORT_QUEUE_SIZE)
+    _REPORT_DROPPED = 0
+    _REPORT_WORKER = None
+    _REPORT_WORKER_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_report_worker)
+
 
 class TimerSentinel:
     """Monitor execution time and log when threshold is exceeded.
@@ -57,17 +208,27 @@ class TimerSentinel:
         do_work()
         timer.end()
         timer.report()
+
+        # Reusing one instance across measurements
+        timer = TimerSentinel(threshold=0.1, name="step")
+        for item in items:
+            with timer.measure():
+                process(item)
     """
 
     __slots__ = (
-        "threshold",
+        "_threshold",
+        "_threshold_ns",
         "name",
         "_logger",
+        "_log",
+        "_is_enabled",
         "_on_exceed_keyword",
         "_on_exceed_level",
-        "_on_exceed_callback",
+        "_bound_callback",
         "_async_callback",
-        "_callback_args",
+        "_async_report",
+        "_swallow_callback_errors",
         "_execution_id",
         "_timer",
         "_total_time",
@@ -78,11 +239,13 @@ class TimerSentinel:
         self,
         threshold: float,
         name: str | None = None,
-        logger: logging.Logger | None = None,
+        logger: logging.Logger | None = default_logger,
         on_exceed_keyword: str = "OVERTIME",
         on_exceed_level: int = logging.WARNING,
         on_exceed_callback: Callable[..., Any] | None = None,
         callback_args: dict[str, Any] | None = None,
+        async_report: bool = False,
+        swallow_callback_errors: bool = False,
     ) -> None:
         """Initialize the timer sentinel.
 
@@ -91,8 +254,9 @@ class TimerSentinel:
             name: Name identifier for the timer. Empty string by default.
                 If empty or used as decorator, will use "TimerSentinel"
                 or the function name respectively.
-            logger: Logger instance to use. If None, uses default
-                TimerSentinel logger.
+            logger: Logger instance to use. Defaults to the TimerSentinel
+                logger. None is still accepted for backward compatibility
+                and selects the same logger.
             on_exceed_keyword: Keyword to include in log message when
                 threshold exceeded. Default is "OVERTIME".
             on_exceed_level: Logging level (integer) to use when threshold
@@ -101,23 +265,61 @@ class TimerSentinel:
                 threshold exceeded. Must be callable without arguments.
             callback_args: Optional keyword arguments to pass to the
                 callback function when invoked.
+            async_report: If True, logging and the callback run on a
+                background daemon thread and report() returns right away.
+                Async callbacks then run with asyncio.run in that thread.
+                At most 1024 reports are queued; further ones are dropped
+                and counted, and the count is logged as a warning on the
+                package's TimerSentinel logger once the worker catches up. Reports still
+                queued at interpreter exit are lost.
+                Default is False.
+            swallow_callback_errors: If True, exceptions raised by the
+                callback are logged with the traceback instead of
+                propagating to the timed code. Errors raised inside an
+                async callback scheduled on a running loop are left to
+                the loop. With async_report=True, errors never reach the
+                caller whatever this flag says; they are logged by the
+                background worker. Default is False.
         """
         self.threshold = threshold
         self._use_func_name = not name
         self.name = name or DEFAULT_TIMER_NAME
-        self._logger = logger or default_logger
+        # None is only handled for callers of the old None default
+        self._logger = default_logger if logger is None else logger
+        self._log = self._logger.log
+        self._is_enabled = self._logger.isEnabledFor
         self._on_exceed_keyword = on_exceed_keyword
         self._on_exceed_level = on_exceed_level
-        self._on_exceed_callback = on_exceed_callback
-        self._callback_args = callback_args or {}
-        self._execution_id: str = uuid4().hex[:8]
-        self._timer: float | None = None
-        self._total_time: float | None = None
+        # Bind the arguments once so report() does not unpack them per call
+        self._bound_callback: Callable[[], Any] | None = (
+            partial(on_exceed_callback, **callback_args)
+            if on_exceed_callback is not None and callback_args
+            else on_exceed_callback
+        )
+        self._async_callback = _is_coro(on_exceed_callback)
+        self._async_report = async_report
+        self._swallow_callback_errors = swallow_callback_errors
+        self._execution_id: str | None = None
+        self._timer: int | None = None
+        self._total_time: int | None = None
+
+    @property
+    def threshold(self) -> float:
+        """Maximum allowed execution time in seconds."""
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, value: float) -> None:
+        self._threshold_ns = _threshold_to_ns(value)
+        self._threshold = value
 
     def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
         """Enable TimerSentinel to be used as a decorator.
 
         Automatically detects async functions and wraps appropriately.
+        If no name was given, the name is set to the function name once
+        at decoration time, and each wrapped function reports under its
+        own name even when one instance decorates several functions.
 
         Args:
             func: The function to wrap and time.
@@ -134,42 +336,49 @@ class TimerSentinel:
             async def my_async_function():
                 await something()
         """
+        if self._use_func_name:
+            self.name = func.__name__
+
         # Check if function is async
-        if inspect.iscoroutinefunction(func):
+        if _is_coro(func):
             return self._wrap_async(func)
         return self._wrap_sync(func)
 
     def _wrap_sync(self, func: Callable[..., Any]) -> Callable[..., Any]:
         """Wrap a synchronous function."""
+        now, report_exceeded = _perf_counter_ns, self._report_exceeded
+        func_name = func.__name__ if self._use_func_name else None
 
         @wraps(func)
         def wrapper(*args: tuple[Any, ...], **kwargs: dict[str, Any]) -> Any:
-            if self._use_func_name:
-                self.name = func.__name__
-
-            self.start()
+            # start()/end() inlined: they always run as a pair here, and
+            # the local start time stays correct for overlapping calls
+            self._timer = start_time = now()
             try:
                 return func(*args, **kwargs)
             finally:
-                self.end()
-                self.report()
+                self._total_time = total_time = now() - start_time
+                if total_time > self._threshold_ns:
+                    report_exceeded(total_time, func_name or self.name)
 
         return wrapper
 
     def _wrap_async(self, func: Callable[..., Any]) -> Callable[..., Any]:
         """Wrap an asynchronous function."""
+        now, report_exceeded = _perf_counter_ns, self._report_exceeded
+        func_name = func.__name__ if self._use_func_name else None
 
         @wraps(func)
         async def wrapper(*args: tuple[Any, ...], **kwargs: dict[str, Any]) -> Any:
-            if self._use_func_name:
-                self.name = func.__name__
-
-            self.start()
+            # start()/end() inlined: they always run as a pair here, and
+            # the local start time stays correct for overlapping calls
+            self._timer = start_time = now()
             try:
                 return await func(*args, **kwargs)
             finally:
-                self.end()
-                self.report()
+                self._total_time = total_time = now() - start_time
+                if total_time > self._threshold_ns:
+                    report_exceeded(total_time, func_name or self.name)
 
         return wrapper
 
@@ -179,7 +388,8 @@ class TimerSentinel:
         Returns:
             Self instance for use in with statement.
         """
-        self.start()
+        # start() inlined to avoid a method call on the context path
+        self._timer = _perf_counter_ns()
         return self
 
     def __exit__(
@@ -195,37 +405,100 @@ class TimerSentinel:
         Note:
             Exceptions are propagated (not suppressed).
         """
-        self.end()
+        # end() inlined to avoid a method call on the context path
+        end_time = _perf_counter_ns()
+        timer = self._timer
+        if timer is None:
+            raise RuntimeError("Timer not started")
+        self._total_time = end_time - timer
         self.report()
 
     def _run_callback(self) -> None:
         """Execute the on_exceed callback, awaiting if it's async."""
-        if not self._on_exceed_callback:
+        if not self._bound_callback:
             return
 
-        if inspect.iscoroutinefunction(self._on_exceed_callback):
-            coro = self._on_exceed_callback(**self._callback_args)
+        if self._async_callback:
+            # Imported lazily: asyncio is only needed for async callbacks
+            import asyncio
+
+            coro = self._bound_callback()
             loop = self._get_running_loop()
             if loop is None:
                 asyncio.run(coro)
             else:
                 loop.create_task(coro)
         else:
-            self._on_exceed_callback(**self._callback_args)
+            self._bound_callback()
 
-    def _get_running_loop(self) -> asyncio.AbstractEventLoop | None:
+    def _safe_run_callback(self, name: str) -> None:
+        """Execute the on_exceed callback, logging any exception it raises.
+
+        Args:
+            name: Name the measurement was reported under.
+        """
+        try:
+            self._run_callback()
+        except Exception:
+            self._logger.exception(
+                "%s | name=%s | callback failed", self._on_exceed_keyword, name
+            )
+
+    def _get_running_loop(self) -> "asyncio.AbstractEventLoop | None":
         """Return the running event loop if present, otherwise None."""
+        import asyncio
+
         try:
             return asyncio.get_running_loop()
         except RuntimeError:
             return None
 
+    def _get_execution_id(self) -> str:
+        """Return the execution id, generating it on first use.
+
+        The id is only needed when a report is logged, so generation is
+        deferred until then.
+        """
+        if self._execution_id is None:
+            self._execution_id = _short_id()
+        return self._execution_id
+
+    def reset(self) -> None:
+        """Clear the timing state so the instance can measure again.
+
+        A new execution id is generated lazily for the next report.
+        """
+        self._timer = None
+        self._total_time = None
+        self._execution_id = None
+
+    def measure(self) -> "TimerSentinel":
+        """Reset the timer and return it for use as a context manager.
+
+        Lets a single instance be reused across many measurements without
+        allocating a new TimerSentinel each time. An instance holds the
+        state of one measurement at a time, so it must not be shared
+        between threads or overlapping tasks.
+
+        Returns:
+            Self instance, ready for use in a with statement.
+
+        Example:
+            timer = TimerSentinel(threshold=0.1)
+            for item in items:
+                with timer.measure():
+                    process(item)
+        """
+        self.reset()
+        return self
+
     def start(self) -> None:
         """Start the timer.
 
-        Records the current time using perf_counter for high precision.
+        Records the current time in nanoseconds using perf_counter_ns
+        for high precision.
         """
-        self._timer = time.perf_counter()
+        self._timer = _perf_counter_ns()
 
     def end(self) -> None:
         """Stop the timer and calculate total execution time.
@@ -233,9 +506,11 @@ class TimerSentinel:
         Raises:
             RuntimeError: If start() was not called before end().
         """
-        if self._timer is None:
+        end_time = _perf_counter_ns()
+        timer = self._timer
+        if timer is None:
             raise RuntimeError("Timer not started")
-        self._total_time = time.perf_counter() - self._timer
+        self._total_time = end_time - timer
 
     def report(self) -> None:
         """Log a message and execute callback if threshold was exceeded.
@@ -246,18 +521,117 @@ class TimerSentinel:
         Raises:
             RuntimeError: If end() was not called before report().
         """
-        if self._total_time is None:
+        total_time = self._total_time
+        if total_time is None:
             raise RuntimeError("Timer not ended")
+        # Fast path: under threshold is the common case
+        if total_time <= self._threshold_ns:
+            return
+        self._report_exceeded(total_time, self.name)
+
+    def _report_exceeded(self, total_time: int, name: str) -> None:
+        """Log and run the callback for a measurement over the threshold.
 
-        if self._total_time > self.threshold:
-            msg = (
-                f"{self._on_exceed_keyword} | "
-                f"name={self.name} | "
-                f"id={self._execution_id} | "
-                f"elapsed={self._total_time:.4f}s | "
-                f"threshold={self.threshold:.4f}s"
+        Args:
+            total_time: Elapsed time in nanoseconds.
+            name: Name to report the measurement under.
+        """
+        level = self._on_exceed_level
+        # Skip the message arguments when the level is filtered out.
+        # Formatting is deferred to logging in case a handler drops it.
+        log_args = (
+            (
+                self._on_exceed_keyword,
+                name,
+                self._get_execution_id(),
+                total_time / 1e9,
+                self._threshold,
             )
-            self._logger.log(self._on_exceed_level, msg)
+            if self._is_enabled(level)
+            else None
+        )
+        callback = None
+        if self._bound_callback:
+            # Only pay for the exception handler when the user opted in
+            callback = (
+                partial(self._safe_run_callback, name)
+                if self._swallow_callback_errors
+                else self._run_callback
+            )
+        if log_args is None and callback is None:
+            # Nothing to log or call back: don't queue or start the worker
+            return
+        report = (self, name, log_args, callback)
+
+        if self._async_report:
+            _submit_report(report)
+        else:
+            _emit_report(report)
+
+
+def sentinel(
+    threshold: float,
+    name: str | None = None,
+    logger: logging.Logger | None = default_logger,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Lightweight decorator that logs a warning when threshold is exceeded.
+
+    A minimal alternative to TimerSentinel for the common case: no
+    callback, no custom keyword or level and no execution id. The wrapper
+    only keeps the start time, the threshold in nanoseconds and the
+    logger's warning method. Message formatting is deferred to logging.
+
+    Args:
+        threshold: Maximum allowed execution time in seconds.
+        name: Name identifier for the timer. Uses the function name if
+            empty.
+        logger: Logger instance to use. Defaults to the TimerSentinel
+            logger. None is also accepted and selects the same logger.
+
+    Returns:
+        Decorator that wraps sync or async functions.
+
+    Raises:
+        ValueError: If threshold is NaN.
+
+    Example:
+        @sentinel(0.5)
+        def api_call():
+            return requests.get(url)
+    """
+    threshold_ns = _threshold_to_ns(threshold)
+    warn = (default_logger if logger is None else logger).warning
+    now = _perf_counter_ns
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        timer_name = name or func.__name__
+
+        if _is_coro(func):
+
+            @wraps(func)
+            async def async_wrapper(
+                *args: tuple[Any, ...], **kwargs: dict[str, Any]
+            ) -> Any:
+                t0 = now()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    elapsed = now() - t0
+                    if elapsed > threshold_ns:
+                        warn(_SENTINEL_MSG, timer_name, elapsed / 1e9, threshold)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args: tuple[Any, ...], **kwargs: dict[str, Any]) -> Any:
+            t0 = now()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = now() - t0
+                if elapsed > threshold_ns:
+                    warn(_SENTINEL_MSG, timer_name, elapsed / 1e9, threshold)
+
+        return wrapper
 
-            if self._on_exceed_callback:
-                self._run_callback()
+    return decorator
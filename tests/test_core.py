@@ -1,11 +1,15 @@
 import asyncio
 import logging
+import os
+import queue
+import threading
 import time
 from typing import Any, Literal, NoReturn
 
 import pytest
 
-from timer_sentinel.core import TimerSentinel
+from timer_sentinel import core
+from timer_sentinel.core import _RAND_POOL_SIZE, TimerSentinel, _short_id, sentinel
 
 
 class TestTimerSentinelImports:
@@ -17,6 +21,12 @@ class TestTimerSentinelImports:
 
         assert TimerSentinel.__name__ == "TimerSentinel"
 
+    def test_short_import_sentinel(self) -> None:
+        """Test if the sentinel shortcut is working fine"""
+        from timer_sentinel import sentinel
+
+        assert sentinel.__name__ == "sentinel"
+
 
 class TestTimerSentinelBasics:
     """Test basic functionality"""
@@ -30,12 +40,84 @@ class TestTimerSentinelBasics:
         assert timer._timer is None
         assert timer._total_time is None
 
+    def test_instances_have_no_dict(self) -> None:
+        """Test __slots__ keeps instances free of a per-instance __dict__."""
+        timer = TimerSentinel(threshold=1.0, on_exceed_callback=print)
+
+        assert not hasattr(timer, "__dict__")
+        with pytest.raises(AttributeError):
+            timer._callback_args = {}  # type: ignore[attr-defined]
+
+    def test_initialization_logger_none_uses_default(self) -> None:
+        """Test logger=None is still accepted and selects the default logger."""
+        assert TimerSentinel(threshold=1.0)._logger is core.default_logger
+        assert TimerSentinel(threshold=1.0, logger=None)._logger is (
+            core.default_logger
+        )
+
     def test_initialization_custom_name(self) -> None:
         """Test TimerSentinel accepts custom name."""
         timer = TimerSentinel(threshold=1.0, name="custom_timer")
 
         assert timer.name == "custom_timer"
 
+    def test_threshold_update_converts_to_ns(self) -> None:
+        """Test updating threshold keeps the nanosecond threshold in sync."""
+        timer = TimerSentinel(threshold=1.0)
+        timer.threshold = 0.25
+
+        assert timer.threshold == 0.25
+        assert timer._threshold_ns == 250_000_000
+
+    def test_infinite_threshold_never_logs(self, caplog: Any) -> None:
+        """Test an infinite threshold is accepted and never exceeded."""
+        with caplog.at_level(logging.WARNING):
+            timer = TimerSentinel(threshold=float("inf"))
+            timer.start()
+            timer.end()
+            timer.report()
+
+        assert timer.threshold == float("inf")
+        assert len(caplog.records) == 0
+
+    @pytest.mark.parametrize(
+        ("threshold", "expected_ns"),
+        [
+            (1e300, core._NEVER_EXCEEDED_NS),
+            (-1e300, -1),
+            (float("-inf"), -1),
+        ],
+    )
+    def test_extreme_threshold_is_clamped(
+        self, threshold: float, expected_ns: int
+    ) -> None:
+        """Test very large or negative thresholds don't overflow."""
+        timer = TimerSentinel(threshold=threshold)
+        sentinel(threshold)
+
+        assert timer.threshold == threshold
+        assert timer._threshold_ns == expected_ns
+
+    def test_negative_threshold_always_exceeded(self, caplog: Any) -> None:
+        """Test a small negative threshold is exceeded by any elapsed time."""
+        with caplog.at_level(logging.WARNING):
+            timer = TimerSentinel(threshold=-1e-12)
+            timer.start()
+            timer.end()
+            timer.report()
+
+        assert len(caplog.records) == 1
+
+    def test_nan_threshold_raises_error(self) -> None:
+        """Test a NaN threshold raises ValueError and keeps the old value."""
+        with pytest.raises(ValueError, match="threshold must not be NaN"):
+            TimerSentinel(threshold=float("nan"))
+
+        timer = TimerSentinel(threshold=1.0)
+        with pytest.raises(ValueError, match="threshold must not be NaN"):
+            timer.threshold = float("nan")
+        assert timer.threshold == 1.0
+
     def test_initialization_empty_name_uses_default(self) -> None:
         """Test empty name falls back to default."""
         timer = TimerSentinel(threshold=1.0, name="")
@@ -52,7 +134,7 @@ class TestTimerSentinelManualUsage:
         timer.start()
 
         assert timer._timer is not None
-        assert isinstance(timer._timer, float)
+        assert isinstance(timer._timer, int)
 
     def test_end_calculates_time(self) -> None:
         """Test end() calculates total time correctly."""
@@ -62,8 +144,9 @@ class TestTimerSentinelManualUsage:
         timer.end()
 
         assert timer._total_time is not None
-        assert timer._total_time >= 0.1
-        assert timer._total_time < 0.5  # Allow some margin
+        assert isinstance(timer._total_time, int)
+        assert timer._total_time >= 100_000_000
+        assert timer._total_time < 500_000_000  # Allow some margin
 
     def test_end_without_start_raises_error(self) -> None:
         """Test end() raises RuntimeError if start() not called."""
@@ -92,7 +175,7 @@ class TestTimerSentinelContextManager:
 
         # After context, timer should be stopped
         assert timer._total_time is not None
-        assert timer._total_time >= 0.1
+        assert timer._total_time >= 100_000_000
 
     def test_context_manager_with_exception(self) -> None:
         """Test context manager propagates exceptions."""
@@ -119,17 +202,52 @@ class TestTimerSentinelDecorator:
         result = slow_function()
         assert result == "done"
 
-    def test_decorator_uses_function_name(self) -> None:
+    def test_decorator_uses_function_name(self, caplog: Any) -> None:
         """Test decorator uses function name when no name provided."""
-        timer_instance = TimerSentinel(threshold=1.0)
+        timer_instance = TimerSentinel(threshold=0.01)
 
         @timer_instance
         def my_function() -> None:
-            pass
+            time.sleep(0.02)
+
+        with caplog.at_level(logging.WARNING):
+            my_function()
 
-        my_function()
+        assert "name=my_function" in caplog.text
         assert timer_instance.name == "my_function"
 
+    def test_decorator_reused_instance_reports_each_name(self, caplog: Any) -> None:
+        """Test one instance decorating several functions reports each name."""
+        timer_instance = TimerSentinel(threshold=0.01)
+
+        @timer_instance
+        def first() -> None:
+            time.sleep(0.02)
+
+        @timer_instance
+        def second() -> None:
+            time.sleep(0.02)
+
+        with caplog.at_level(logging.WARNING):
+            second()
+            first()
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert "name=second" in messages[0]
+        assert "name=first" in messages[1]
+
+    def test_decorator_explicit_name_is_kept(self, caplog: Any) -> None:
+        """Test an explicit name is used instead of the function name."""
+
+        @TimerSentinel(threshold=0.01, name="explicit")
+        def my_function() -> None:
+            time.sleep(0.02)
+
+        with caplog.at_level(logging.WARNING):
+            my_function()
+
+        assert "name=explicit" in caplog.text
+
     def test_decorator_with_arguments(self) -> None:
         """Test decorator works with function arguments."""
 
@@ -204,6 +322,18 @@ class TestTimerSentinelLogging:
         assert len(caplog.records) == 1
         assert caplog.records[0].levelno == logging.ERROR
 
+    def test_no_log_when_level_disabled(self, caplog: Any) -> None:
+        """Test no log and no execution id when the level is disabled."""
+        with caplog.at_level(logging.ERROR):
+            timer = TimerSentinel(threshold=0.05, name="test")
+            timer.start()
+            time.sleep(0.1)
+            timer.end()
+            timer.report()
+
+        assert len(caplog.records) == 0
+        assert timer._execution_id is None
+
 
 class TestTimerSentinelCallback:
     """Test callback functionality."""
@@ -257,6 +387,44 @@ class TestTimerSentinelCallback:
         assert results["name"] == "test_name"
         assert results["value"] == 42
 
+    def test_callback_error_propagates_by_default(self) -> None:
+        """Test callback exceptions propagate unless swallowing is enabled."""
+
+        def callback() -> NoReturn:
+            raise ValueError("Callback error")
+
+        timer = TimerSentinel(threshold=0.01, on_exceed_callback=callback)
+        timer.start()
+        time.sleep(0.02)
+        timer.end()
+
+        with pytest.raises(ValueError, match="Callback error"):
+            timer.report()
+
+    def test_swallow_callback_errors_logs_exception(self, caplog: Any) -> None:
+        """Test swallow_callback_errors logs the callback exception."""
+
+        def callback() -> NoReturn:
+            raise ValueError("Callback error")
+
+        timer = TimerSentinel(
+            threshold=0.01,
+            name="test",
+            on_exceed_callback=callback,
+            swallow_callback_errors=True,
+        )
+
+        with caplog.at_level(logging.WARNING):
+            timer.start()
+            time.sleep(0.02)
+            timer.end()
+            timer.report()
+
+        assert len(caplog.records) == 2
+        assert caplog.records[1].levelno == logging.ERROR
+        assert caplog.records[1].exc_info is not None
+        assert "callback failed" in caplog.text
+
 
 class TestTimerSentinelEdgeCases:
     """Test edge cases and special scenarios."""
@@ -286,9 +454,216 @@ class TestTimerSentinelEdgeCases:
         timer1 = TimerSentinel(threshold=1.0)
         timer2 = TimerSentinel(threshold=1.0)
 
-        assert timer1._execution_id != timer2._execution_id
-        assert len(timer1._execution_id) == 8
-        assert len(timer2._execution_id) == 8
+        assert timer1._get_execution_id() != timer2._get_execution_id()
+        assert len(timer1._get_execution_id()) == 8
+        assert len(timer2._get_execution_id()) == 8
+
+    def test_short_id_across_pool_refills(self) -> None:
+        """Test ids stay 8 hex chars long when the random pool refills."""
+        ids = [_short_id() for _ in range(_RAND_POOL_SIZE // 4 + 1)]
+
+        assert all(len(i) == 8 for i in ids)
+        assert all(c in "0123456789abcdef" for i in ids for c in i)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    @pytest.mark.filterwarnings("ignore:.*fork.*:DeprecationWarning")
+    def test_short_id_differs_after_fork(self) -> None:
+        """Test a forked child doesn't reuse the parent's random pool."""
+        _short_id()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            os.write(write_fd, _short_id().encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        child_id = os.read(read_fd, 8).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert len(child_id) == 8
+        assert child_id != _short_id()
+
+    def test_execution_id_is_lazy(self) -> None:
+        """Test execution ID is only generated when first requested."""
+        timer = TimerSentinel(threshold=1.0)
+        timer.start()
+        timer.end()
+        timer.report()
+
+        assert timer._execution_id is None
+        execution_id = timer._get_execution_id()
+        assert timer._get_execution_id() == execution_id
+
+
+class TestTimerSentinelReuse:
+    """Test reset() and measure() for reusing one instance."""
+
+    def test_reset_clears_state(self) -> None:
+        """Test reset() clears timing state and execution ID."""
+        timer = TimerSentinel(threshold=1.0)
+        timer.start()
+        timer.end()
+        timer._get_execution_id()
+        timer.reset()
+
+        assert timer._timer is None
+        assert timer._total_time is None
+        assert timer._execution_id is None
+
+    def test_measure_returns_reset_instance(self) -> None:
+        """Test measure() resets the timer and returns the same instance."""
+        timer = TimerSentinel(threshold=1.0)
+        timer.start()
+        timer.end()
+
+        assert timer.measure() is timer
+        assert timer._total_time is None
+
+    def test_measure_reused_as_context_manager(self, caplog: Any) -> None:
+        """Test measure() times each window and reports with a new ID."""
+        timer = TimerSentinel(threshold=0.05, name="loop")
+        ids = []
+
+        with caplog.at_level(logging.WARNING):
+            for _ in range(2):
+                with timer.measure():
+                    time.sleep(0.1)
+                ids.append(timer._execution_id)
+
+        assert len(caplog.records) == 2
+        assert None not in ids
+        assert ids[0] != ids[1]
+
+
+class TestTimerSentinelAsyncReport:
+    """Test opt-in background reporting."""
+
+    def test_async_report_logs_and_calls_back_in_worker(self, caplog: Any) -> None:
+        """Test async_report logs and runs the callback on the worker thread."""
+        done = threading.Event()
+        called: dict[str, Any] = {}
+
+        def callback(name: str) -> None:
+            called["name"] = name
+            called["thread"] = threading.current_thread().name
+            done.set()
+
+        timer = TimerSentinel(
+            threshold=0.01,
+            name="background",
+            on_exceed_callback=callback,
+            callback_args={"name": "queued"},
+            async_report=True,
+        )
+
+        with caplog.at_level(logging.WARNING):
+            timer.start()
+            time.sleep(0.02)
+            timer.end()
+            timer.report()
+
+            assert done.wait(timeout=1.0)
+
+        assert called["name"] == "queued"
+        assert called["thread"] == "TimerSentinelReporter"
+        assert len(caplog.records) == 1
+        assert "background" in caplog.text
+
+    def test_async_report_logs_failure_to_timer_logger(self, caplog: Any) -> None:
+        """Test background callback failures go to the timer's own logger."""
+        done = threading.Event()
+
+        def callback() -> NoReturn:
+            done.set()
+            raise ValueError("Callback error")
+
+        logger = logging.getLogger("custom_background")
+        timer = TimerSentinel(
+            threshold=0.01,
+            name="background",
+            logger=logger,
+            on_exceed_keyword="SLOW",
+            on_exceed_callback=callback,
+            async_report=True,
+        )
+
+        with caplog.at_level(logging.WARNING):
+            timer.start()
+            time.sleep(0.02)
+            timer.end()
+            timer.report()
+
+            assert done.wait(timeout=1.0)
+            for _ in range(100):
+                if len(caplog.records) == 2:
+                    break
+                time.sleep(0.01)
+
+        failure = caplog.records[1]
+        assert failure.name == "custom_background"
+        assert failure.levelno == logging.ERROR
+        assert failure.exc_info is not None
+        assert failure.getMessage() == (
+            "SLOW | name=background | background report failed"
+        )
+
+    def test_async_report_skips_empty_report(self, monkeypatch: Any) -> None:
+        """Test nothing is queued when the level is disabled and no callback."""
+        submitted: list[Any] = []
+        monkeypatch.setattr(core, "_submit_report", submitted.append)
+
+        logger = logging.getLogger("disabled_background")
+        logger.setLevel(logging.CRITICAL)
+        timer = TimerSentinel(threshold=-1, logger=logger, async_report=True)
+        try:
+            timer.start()
+            timer.end()
+            timer.report()
+        finally:
+            logger.setLevel(logging.NOTSET)
+
+        assert submitted == []
+
+    def test_async_report_drops_when_queue_full(self, monkeypatch: Any) -> None:
+        """Test reports are dropped and counted when the queue is full."""
+        full_queue: queue.Queue[Any] = queue.Queue(maxsize=1)
+        full_queue.put_nowait(None)
+        monkeypatch.setattr(core, "_REPORT_QUEUE", full_queue)
+        monkeypatch.setattr(core, "_REPORT_DROPPED", 0)
+        # Pretend the worker is running so none is started on the test queue
+        monkeypatch.setattr(core, "_REPORT_WORKER", threading.current_thread())
+
+        timer = TimerSentinel(threshold=0.01, async_report=True)
+        timer.start()
+        time.sleep(0.02)
+        timer.end()
+        timer.report()
+
+        assert full_queue.qsize() == 1
+        assert core._REPORT_DROPPED == 1
+
+    def test_async_report_not_queued_under_threshold(self, monkeypatch: Any) -> None:
+        """Test async_report only queues a report when threshold exceeded."""
+        submitted: list[Any] = []
+        monkeypatch.setattr(core, "_submit_report", submitted.append)
+
+        timer = TimerSentinel(
+            threshold=0.01, on_exceed_callback=lambda: None, async_report=True
+        )
+        timer.start()
+        timer.end()
+        timer.report()
+
+        assert submitted == []
+
+        timer.start()
+        time.sleep(0.02)
+        timer.end()
+        timer.report()
+
+        assert len(submitted) == 1
 
 
 class TestTimerSentinelAsyncDecorator:
@@ -307,15 +682,18 @@ class TestTimerSentinelAsyncDecorator:
         assert result == "done"
 
     @pytest.mark.asyncio
-    async def test_async_decorator_uses_function_name(self) -> None:
+    async def test_async_decorator_uses_function_name(self, caplog: Any) -> None:
         """Test async decorator uses function name when no name provided."""
-        timer_instance = TimerSentinel(threshold=1.0)
+        timer_instance = TimerSentinel(threshold=0.01)
 
         @timer_instance
         async def my_async_function() -> None:
             await asyncio.sleep(0.05)
 
-        await my_async_function()
+        with caplog.at_level(logging.WARNING):
+            await my_async_function()
+
+        assert "name=my_async_function" in caplog.text
         assert timer_instance.name == "my_async_function"
 
     @pytest.mark.asyncio
@@ -450,6 +828,25 @@ class TestTimerSentinelAsyncDecorator:
 
         assert results == [0, 1, 2, 3, 4]
 
+    @pytest.mark.asyncio
+    async def test_async_overlapping_calls_time_independently(
+        self, caplog: Any
+    ) -> None:
+        """Test a later overlapping call doesn't shorten an earlier one."""
+
+        @TimerSentinel(threshold=0.08, name="overlap")
+        async def task(delay: float) -> None:
+            await asyncio.sleep(delay)
+
+        async def delayed_short_task() -> None:
+            await asyncio.sleep(0.06)
+            await task(0.01)
+
+        with caplog.at_level(logging.WARNING):
+            await asyncio.gather(task(0.12), delayed_short_task())
+
+        assert len(caplog.records) == 1
+
 
 class TestTimerSentinelAsyncCallback:
     """Test async callback detection and execution strategies."""
@@ -570,3 +967,116 @@ class TestTimerSentinelAsyncCallback:
         timer.end()
         # Should complete without raising any exceptions
         timer.report()
+
+
+class TestSentinelDecorator:
+    """Test the lightweight sentinel decorator."""
+
+    def test_sentinel_returns_result(self) -> None:
+        """Test sentinel decorator returns the wrapped function result."""
+
+        @sentinel(1.0)
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        assert add(2, 3) == 5
+
+    def test_sentinel_preserves_function_metadata(self) -> None:
+        """Test sentinel decorator preserves function name and docstring."""
+
+        @sentinel(1.0)
+        def documented_function() -> None:
+            """This is a docstring."""
+
+        assert documented_function.__name__ == "documented_function"
+        assert documented_function.__doc__ == "This is a docstring."
+
+    def test_sentinel_no_log_under_threshold(self, caplog: Any) -> None:
+        """Test sentinel doesn't log when under threshold."""
+        with caplog.at_level(logging.WARNING):
+
+            @sentinel(1.0)
+            def fast_function() -> None:
+                pass
+
+            fast_function()
+
+        assert len(caplog.records) == 0
+
+    def test_sentinel_logs_when_exceeds_threshold(self, caplog: Any) -> None:
+        """Test sentinel logs with the function name when threshold exceeded."""
+        with caplog.at_level(logging.WARNING):
+
+            @sentinel(0.05)
+            def slow_function() -> None:
+                time.sleep(0.1)
+
+            slow_function()
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].levelno == logging.WARNING
+        assert "OVERTIME" in caplog.text
+        assert "slow_function" in caplog.text
+
+    def test_sentinel_custom_name_and_logger(self, caplog: Any) -> None:
+        """Test sentinel uses the given name and logger."""
+        logger = logging.getLogger("custom")
+        with caplog.at_level(logging.WARNING):
+
+            @sentinel(0.05, name="custom_name", logger=logger)
+            def slow_function() -> None:
+                time.sleep(0.1)
+
+            slow_function()
+
+        assert caplog.records[0].name == "custom"
+        assert "custom_name" in caplog.text
+
+    def test_sentinel_logs_on_exception(self, caplog: Any) -> None:
+        """Test sentinel still reports when the function raises."""
+        with caplog.at_level(logging.WARNING):
+
+            @sentinel(0.05)
+            def failing_function() -> NoReturn:
+                time.sleep(0.1)
+                raise ValueError("Test error")
+
+            with pytest.raises(ValueError, match="Test error"):
+                failing_function()
+
+        assert len(caplog.records) == 1
+
+    def test_sentinel_infinite_threshold_never_logs(self, caplog: Any) -> None:
+        """Test sentinel accepts an infinite threshold and never logs."""
+        with caplog.at_level(logging.WARNING):
+
+            @sentinel(float("inf"))
+            def function() -> None:
+                pass
+
+            function()
+
+        assert len(caplog.records) == 0
+
+    def test_sentinel_nan_threshold_raises_error(self) -> None:
+        """Test sentinel rejects a NaN threshold."""
+        with pytest.raises(ValueError, match="threshold must not be NaN"):
+            sentinel(float("nan"))
+
+    @pytest.mark.asyncio
+    async def test_sentinel_async_logs_when_exceeds_threshold(
+        self, caplog: Any
+    ) -> None:
+        """Test sentinel wraps async functions and logs when exceeded."""
+        with caplog.at_level(logging.WARNING):
+
+            @sentinel(0.05)
+            async def slow_async_task() -> Literal["done"]:
+                await asyncio.sleep(0.1)
+                return "done"
+
+            result = await slow_async_task()
+
+        assert result == "done"
+        assert len(caplog.records) == 1
+        assert "slow_async_task" in caplog.text